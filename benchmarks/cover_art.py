@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""Benchmark cover art resizing against generated sample images.
+
+Usage: python benchmarks/cover_art.py [iterations]
+"""
+
+import io
+import sys
+import time
+import random
+import importlib.util
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFilter
+
+INTEGRATION_PATH = Path(__file__).parent.parent / "custom_components" / "vsslctrl"
+
+
+def load_module(name: str):
+    """Load a module directly so Home Assistant isnt required."""
+    spec = importlib.util.spec_from_file_location(name, INTEGRATION_PATH / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+const = load_module("const")
+cover_art = load_module("cover_art")
+
+SAMPLES = [
+    ("3000px JPEG", 3000, "JPEG"),
+    ("1400px JPEG", 1400, "JPEG"),
+    ("1400px PNG", 1400, "PNG"),
+    ("640px JPEG", 640, "JPEG"),
+]
+
+
+def sample_image(size: int, format: str) -> bytes:
+    """Build artwork like image, shapes over a gradient with some grain."""
+    rnd = random.Random(size)
+    image = Image.linear_gradient("L").resize((size, size)).convert("RGB")
+    draw = ImageDraw.Draw(image)
+    for _ in range(40):
+        x, y = rnd.randrange(size), rnd.randrange(size)
+        r = rnd.randrange(size // 20, size // 4)
+        colour = tuple(rnd.randrange(256) for _ in range(3))
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=colour)
+    image = image.filter(ImageFilter.GaussianBlur(size / 500))
+    noise = Image.effect_noise((size, size), 24).convert("RGB")
+    image = Image.blend(image, noise, 0.15)
+
+    output = io.BytesIO()
+    image.save(output, format=format, quality=95)
+    return output.getvalue()
+
+
+def main(iterations: int) -> None:
+    print(f"{'sample':<14}{'variant':<11}{'in KB':>9}{'out KB':>9}{'ms':>9}")
+    for name, size, format in SAMPLES:
+        content = sample_image(size, format)
+        for variant, variant_size in const.COVER_ART_SIZES.items():
+            start = time.perf_counter()
+            for _ in range(iterations):
+                resized, _ = cover_art.resize_cover_art(content, variant_size)
+            elapsed = (time.perf_counter() - start) / iterations * 1000
+            print(
+                f"{name:<14}{variant:<11}{len(content) / 1024:>9.1f}"
+                f"{len(resized) / 1024:>9.1f}{elapsed:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -1,7 +1,9 @@
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_REBOOT
 
 from vsslctrl import Vssl, Zone, VSSL_NAME
 
@@ -12,6 +14,27 @@ class VsslBaseEntity(Entity):
     def __init__(self, vssl: Vssl) -> None:
         """Initialize the VSSL entity."""
         self.vssl = vssl
+        self._rebooting = False
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to device reboots."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_REBOOT.format(self.vssl.serial), self._async_rebooting
+            )
+        )
+
+    @callback
+    def _async_rebooting(self, rebooting: bool) -> None:
+        """Mark unavailable while the device is rebooting."""
+        self._rebooting = rebooting
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return True if the device is not rebooting."""
+        return not self._rebooting
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -12,6 +12,7 @@ from homeassistant.const import EntityCategory
 
 from .const import DOMAIN
 from .base import VsslBaseEntity
+from .reboot import VsslReboot
 
 from vsslctrl import Vssl, Zone, VSSL_NAME
 
@@ -23,7 +24,7 @@ async def async_setup_entry(
 ) -> None:
     """Set buttons for device."""
     vssl = hass.data[DOMAIN][config_entry.entry_id]
-    async_add_entities([RebootButton(vssl)])
+    async_add_entities([RebootButton(hass, config_entry, vssl)])
 
 
 class RebootButton(VsslBaseEntity, ButtonEntity):
@@ -32,12 +33,13 @@ class RebootButton(VsslBaseEntity, ButtonEntity):
     _attr_device_class = ButtonDeviceClass.RESTART
     _attr_entity_category = EntityCategory.CONFIG
 
-    def __init__(self, vssl: Vssl) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, vssl: Vssl) -> None:
         """Initialize the button entity."""
         super().__init__(vssl)
+        self._reboot = VsslReboot(hass, entry, vssl)
         self._attr_name = f"{self.vssl.settings.name} Reboot"
         self._attr_unique_id = f"{self.vssl.serial}_reboot"
 
     async def async_press(self) -> None:
-        """Reboot all zones."""
-        self.vssl.reboot()
+        """Reboot all zones, firing an event once they are ready."""
+        self._reboot.start()
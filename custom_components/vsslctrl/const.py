@@ -6,6 +6,29 @@ SERIAL = "serial"
 ZONES = "zones"
 MODEL = "model"
 
+EVENT_NOW_PLAYING = f"{DOMAIN}_now_playing"
+
+EVENT_REBOOT = f"{DOMAIN}_reboot"
+
+SIGNAL_REBOOT = f"{DOMAIN}_reboot_{{}}"
+
+ATTR_SERIAL = "serial"
+ATTR_READY = "ready"
+ATTR_DURATION = "duration"
+ATTR_ZONE_ID = "zone_id"
+ATTR_TITLE = "title"
+ATTR_ARTIST = "artist"
+ATTR_ALBUM = "album"
+ATTR_SOURCE = "source"
+ATTR_ENTITY_PICTURE_THUMBNAIL = "entity_picture_thumbnail"
+
+COVER_ART_THUMBNAIL = "thumbnail"
+COVER_ART_CARD = "card"
+COVER_ART_SIZES = {
+    COVER_ART_THUMBNAIL: 150,
+    COVER_ART_CARD: 500,
+}
+
 INPUT_MODEL = "INPUT_MODEL"
 INPUT_ZONE_IP_1 = "INPUT_ZONE_IP_1"
 INPUT_ZONE_IP_2 = "INPUT_ZONE_IP_2"
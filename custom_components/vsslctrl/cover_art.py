@@ -0,0 +1,28 @@
+"""Cover art resizing for the VSSL integration."""
+
+import io
+
+from PIL import Image
+
+COVER_ART_CONTENT_TYPE = "image/jpeg"
+COVER_ART_QUALITY = 80
+
+
+def resize_cover_art(content: bytes, size: int) -> tuple[bytes, str]:
+    """Resize and recompress cover art to fit within size x size pixels.
+
+    This is CPU bound so must be run in the executor.
+    """
+    with Image.open(io.BytesIO(content)) as image:
+        # Already small enough and compressed, so dont recompress
+        if max(image.size) <= size and image.format == "JPEG":
+            return content, COVER_ART_CONTENT_TYPE
+
+        image.draft("RGB", (size, size))
+        image = image.convert("RGB")
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+
+        output = io.BytesIO()
+        image.save(output, format="JPEG", quality=COVER_ART_QUALITY, optimize=True)
+
+    return output.getvalue(), COVER_ART_CONTENT_TYPE
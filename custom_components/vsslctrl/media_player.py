@@ -2,6 +2,11 @@ import asyncio
 import logging
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.components.media_player import (
+    ATTR_MEDIA_ALBUM_ARTIST,
+    ATTR_MEDIA_ALBUM_NAME,
+    ATTR_MEDIA_ARTIST,
+    ATTR_MEDIA_DURATION,
+    ATTR_MEDIA_TITLE,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerDeviceClass,
@@ -11,8 +16,9 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.util import dt
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.const import ATTR_ENTITY_ID, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity_registry import async_get as entity_registry_get
@@ -20,9 +26,23 @@ from homeassistant.components.media_player import DOMAIN as MP_DOMAIN
 
 from homeassistant.helpers import entity_registry as er
 from typing import cast
-
-from .const import DOMAIN
+from PIL import Image
+
+from .const import (
+    DOMAIN,
+    EVENT_NOW_PLAYING,
+    ATTR_ZONE_ID,
+    ATTR_TITLE,
+    ATTR_ARTIST,
+    ATTR_ALBUM,
+    ATTR_SOURCE,
+    ATTR_ENTITY_PICTURE_THUMBNAIL,
+    COVER_ART_CARD,
+    COVER_ART_THUMBNAIL,
+    COVER_ART_SIZES,
+)
 from .base import VsslBaseEntity
+from .cover_art import resize_cover_art
 
 from vsslctrl import Vssl, Zone, VSSL_NAME
 from vsslctrl.transport import ZoneTransport
@@ -43,6 +63,15 @@ SOURCES = {
     InputRouter.Sources.OPTICAL_IN: "Optical Input",
 }
 
+# Title, artist and album arrive as separate events, so wait for them to settle
+NOW_PLAYING_COOLDOWN = 1.0
+
+NOW_PLAYING_EVENTS = (
+    TrackMetadata.Events.TITLE_CHANGE,
+    TrackMetadata.Events.ARTIST_CHANGE,
+    TrackMetadata.Events.ALBUM_CHANGE,
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -67,6 +96,20 @@ class VSSLZoneEntity(VsslBaseEntity, MediaPlayerEntity):
     _attr_volume_step = 0.2
     _attr_media_image_remotely_accessible = False
 
+    # Track metadata changes with every track, so dont record it on each state write.
+    # Track changes are logged with the compact EVENT_NOW_PLAYING event instead,
+    # position, artwork and source list are already excluded by the media player.
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_MEDIA_TITLE,
+            ATTR_MEDIA_ARTIST,
+            ATTR_MEDIA_ALBUM_NAME,
+            ATTR_MEDIA_ALBUM_ARTIST,
+            ATTR_MEDIA_DURATION,
+            ATTR_ENTITY_PICTURE_THUMBNAIL,
+        }
+    )
+
     _attr_supported_features = (
         MediaPlayerEntityFeature.PLAY
         | MediaPlayerEntityFeature.PAUSE
@@ -97,6 +140,21 @@ class VSSLZoneEntity(VsslBaseEntity, MediaPlayerEntity):
         }
         self._attr_source_list = list(self._supported_sources.values())
 
+        # Resized cover art variants for the current track, keyed by size name
+        self._cover_art_url = None
+        self._cover_art = {}
+        self._cover_art_lock = asyncio.Lock()
+
+        # Last track announced on the HA event bus
+        self._now_playing = None
+        self._now_playing_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=NOW_PLAYING_COOLDOWN,
+            immediate=False,
+            function=self._fire_now_playing,
+        )
+
         # Subscribe to events for this zone
         vssl.event_bus.subscribe(Vssl.Events.ALL, self._update_ha_state, zone.id)
 
@@ -116,6 +174,41 @@ class VSSLZoneEntity(VsslBaseEntity, MediaPlayerEntity):
         else:
             self.async_write_ha_state()
 
+        if event_type in NOW_PLAYING_EVENTS:
+            self._now_playing_debouncer.async_schedule_call()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending now playing event."""
+        self._now_playing_debouncer.async_shutdown()
+
+    #
+    # Fire a compact event when the playing track changes
+    #
+    async def _fire_now_playing(self) -> None:
+        track = self.zone.track
+        now_playing = (track.title, track.artist, track.album)
+
+        # Reset when the track clears, so replaying the same track fires again
+        if not track.title:
+            self._now_playing = None
+            return
+
+        if now_playing == self._now_playing:
+            return
+
+        self._now_playing = now_playing
+        self.hass.bus.async_fire(
+            EVENT_NOW_PLAYING,
+            {
+                ATTR_ENTITY_ID: self.entity_id,
+                ATTR_ZONE_ID: self.zone.id,
+                ATTR_TITLE: track.title,
+                ATTR_ARTIST: track.artist,
+                ATTR_ALBUM: track.album,
+                ATTR_SOURCE: self.source,
+            },
+        )
+
     #
     # Decorate Helper to check if zone is connected when issuing commands
     #
@@ -281,11 +374,72 @@ class VSSLZoneEntity(VsslBaseEntity, MediaPlayerEntity):
 
             self.zone.input.source = real_source
 
+    @property
+    def extra_state_attributes(self) -> dict[str, str] | None:
+        """Thumbnail variant of the current cover art."""
+        if self.media_image_hash is None:
+            return None
+
+        return {
+            ATTR_ENTITY_PICTURE_THUMBNAIL: self.get_browse_image_url(
+                self.media_content_type, self.media_image_hash, COVER_ART_THUMBNAIL
+            )
+        }
+
     async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
         """Fetch media image of current playing image."""
+        return await self._async_get_cover_art(COVER_ART_CARD)
+
+    async def async_get_browse_image(
+        self,
+        media_content_type: str,
+        media_content_id: str,
+        media_image_id: str | None = None,
+    ) -> tuple[bytes | None, str | None]:
+        """Fetch a size variant of the current cover art, e.g thumbnail."""
+        if (
+            media_image_id not in COVER_ART_SIZES
+            or media_content_id != self.media_image_hash
+        ):
+            return None, None
+
+        return await self._async_get_cover_art(media_image_id)
 
-        # Prevent HA caching default cover art between songs
-        if self.zone.track.source == TrackMetadata.Sources.AIRPLAY:
-            await asyncio.sleep(1)
+    #
+    # Resize and recompress the cover art once per track and size
+    #
+    async def _async_get_cover_art(self, size: str) -> tuple[bytes | None, str | None]:
+        url = self.media_image_url
+        if url is None:
+            return None, None
+
+        async with self._cover_art_lock:
+            if url != self._cover_art_url:
+                self._cover_art_url = url
+                self._cover_art = {}
+
+            if size in self._cover_art:
+                return self._cover_art[size]
+
+            # Prevent HA caching default cover art between songs, only needed for
+            # the first fetch of a track as later sizes reuse the HA image cache
+            if (
+                not self._cover_art
+                and self.zone.track.source == TrackMetadata.Sources.AIRPLAY
+            ):
+                await asyncio.sleep(1)
+
+            content, content_type = await self._async_fetch_image_from_cache(url)
+            if content is None:
+                return None, None
+
+            try:
+                image = await self.hass.async_add_executor_job(
+                    resize_cover_art, content, COVER_ART_SIZES[size]
+                )
+            except (OSError, ValueError, Image.DecompressionBombError) as e:
+                _LOGGER.debug(f"Unable to resize cover art {url}: {e}")
+                image = (content, content_type)
 
-        return await super().async_get_media_image()
+            self._cover_art[size] = image
+            return image
@@ -0,0 +1,180 @@
+"""Tracked reboot of a VSSL device."""
+
+import asyncio
+import logging
+import time
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from vsslctrl import Vssl, Zone
+from vsslctrl.discovery import fetch_zone_id_serial
+
+from .const import (
+    DOMAIN,
+    EVENT_REBOOT,
+    SIGNAL_REBOOT,
+    ATTR_SERIAL,
+    ATTR_READY,
+    ATTR_DURATION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Give the reboot request time to leave the send queue before disconnecting
+REBOOT_SEND_DELAY = 2
+# Zones not seen going down within this time are assumed to be rebooting anyway
+REBOOT_DOWN_TIMEOUT = 30
+# Give up waiting for zones and let the entry reload retry from here
+REBOOT_TIMEOUT = 300
+REBOOT_PROBE_TIMEOUT = 5
+REBOOT_BACKOFF_MIN = 2
+REBOOT_BACKOFF_MAX = 30
+
+
+class VsslReboot:
+    """Reboot a VSSL and reload the entry once all zones are ready."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, vssl: Vssl) -> None:
+        """Initialize the reboot."""
+        self.hass = hass
+        self.entry = entry
+        self.vssl = vssl
+        self._task = None
+        self._reloading = False
+
+        entry.async_on_unload(self._async_cancel)
+
+    @property
+    def in_progress(self) -> bool:
+        """Return True if a reboot is being tracked."""
+        return self._task is not None and not self._task.done()
+
+    @callback
+    def _async_cancel(self) -> None:
+        """Stop tracking the reboot if the entry is unloaded, unless we are reloading it."""
+        if self.in_progress and not self._reloading:
+            self._task.cancel()
+
+    def start(self) -> None:
+        """Send the reboot request and track the zones until they are ready."""
+        if self.in_progress:
+            raise HomeAssistantError(f"{self.vssl.settings.name} is already rebooting")
+
+        if not self.vssl.get_connected_zone():
+            raise HomeAssistantError(
+                f"{self.vssl.settings.name} has no connected zones to reboot"
+            )
+
+        self.vssl.reboot()
+
+        # Mark the entities unavailable straight away
+        async_dispatcher_send(self.hass, SIGNAL_REBOOT.format(self.vssl.serial), True)
+
+        self._task = self.hass.async_create_background_task(
+            self._async_reboot(), f"{DOMAIN} reboot {self.vssl.serial}"
+        )
+
+    async def _async_reboot(self) -> None:
+        started = time.monotonic()
+        ready = False
+
+        # Unload cancels us and is left to propagate, anything else must still
+        # reconnect the zones and report the reboot
+        try:
+            ready = await self._async_wait_for_reboot(started + REBOOT_TIMEOUT)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(f"Error tracking {self.vssl.settings.name} reboot")
+
+        # Reconnect with a fresh VSSL, setup will retry if any zones arent ready
+        if self.entry.state is ConfigEntryState.LOADED:
+            self._reloading = True
+            await self.hass.config_entries.async_reload(self.entry.entry_id)
+        else:
+            # Entry is retrying setup or being reloaded, which recreates the entities
+            _LOGGER.debug(
+                f"Skipping reload of {self.vssl.settings.name}, entry is {self.entry.state}"
+            )
+
+        duration = round(time.monotonic() - started, 1)
+        _LOGGER.info(f"{self.vssl.settings.name} reboot completed in {duration} seconds")
+
+        self.hass.bus.async_fire(
+            EVENT_REBOOT,
+            {
+                ATTR_SERIAL: self.vssl.serial,
+                ATTR_READY: ready,
+                ATTR_DURATION: duration,
+            },
+        )
+
+    async def _async_wait_for_reboot(self, deadline: float) -> bool:
+        """Disconnect and wait for all zones to be ready, or the deadline."""
+        await asyncio.sleep(REBOOT_SEND_DELAY)
+
+        # Take over reconnecting from vsslctrl, so the zones dont reconnect in a burst
+        await self.vssl.disconnect()
+
+        results = await asyncio.gather(
+            *[
+                self._async_wait_for_zone(zone, deadline)
+                for zone in self.vssl.zones.values()
+            ]
+        )
+        ready = all(results)
+        if not ready:
+            _LOGGER.error(
+                f"Timed out waiting for {self.vssl.settings.name} zones after reboot"
+            )
+
+        return ready
+
+    async def _async_wait_for_zone(self, zone: Zone, deadline: float) -> bool:
+        """Wait for a zone to go down, then come back with its ID and serial."""
+        down_deadline = min(time.monotonic() + REBOOT_DOWN_TIMEOUT, deadline)
+        while await self._async_probe(zone):
+            if time.monotonic() >= down_deadline:
+                _LOGGER.warning(f"Zone {zone.id} was not seen going down for reboot")
+                break
+            await asyncio.sleep(REBOOT_BACKOFF_MIN)
+
+        backoff = REBOOT_BACKOFF_MIN
+        while not await self._async_probe(zone):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _LOGGER.error(f"Zone {zone.id} was not ready after reboot")
+                return False
+
+            _LOGGER.debug(f"Zone {zone.id} not ready, probing again in {backoff} seconds")
+            await asyncio.sleep(min(backoff, remaining))
+            backoff = min(backoff * 2, REBOOT_BACKOFF_MAX)
+
+        _LOGGER.info(f"Zone {zone.id} is ready after reboot")
+        return True
+
+    async def _async_probe(self, zone: Zone) -> bool:
+        """Check the zone responds with the expected ID and VSSL serial."""
+
+        # fetch_zone_id_serial swallows cancellation, so run it in its own task
+        # and never cancel the reboot task to time it out
+        probe = asyncio.ensure_future(fetch_zone_id_serial(zone.host))
+        probe.add_done_callback(_consume_probe_result)
+        try:
+            await asyncio.wait({probe}, timeout=REBOOT_PROBE_TIMEOUT)
+        finally:
+            if not probe.done():
+                probe.cancel()
+
+        if not probe.done() or probe.cancelled() or probe.exception():
+            return False
+
+        zone_id, serial = probe.result()
+        return int(zone_id) == zone.id and serial == self.vssl.serial
+
+
+def _consume_probe_result(probe: asyncio.Future) -> None:
+    """Retrieve the probe exception so abandoned probes arent logged as errors."""
+    if not probe.cancelled():
+        probe.exception()